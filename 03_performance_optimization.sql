@@ -250,6 +250,41 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Helper: Parse a YYYY-MM-DD string to DATE, returning NULL instead of raising
+-- (set-based ETL validation). The regex guard rejects 'today', 'epoch', 'infinity'
+-- and other non-ISO inputs; STABLE because text::date depends on session settings.
+CREATE OR REPLACE FUNCTION try_cast_date(p_value TEXT)
+RETURNS DATE AS $$
+BEGIN
+    IF p_value !~ '^\d{4}-\d{1,2}-\d{1,2}$' THEN
+        RETURN NULL;
+    END IF;
+    RETURN p_value::DATE;
+EXCEPTION WHEN OTHERS THEN
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- Helper: Parse a decimal string to DOUBLE PRECISION the way the Python ETL
+-- validator does, returning NULL instead of raising (set-based ETL validation).
+-- 'NaN', 'Infinity' and values too large for a double are rejected; values too
+-- small for one read as 0.
+CREATE OR REPLACE FUNCTION try_cast_float(p_value TEXT)
+RETURNS DOUBLE PRECISION AS $$
+BEGIN
+    IF p_value !~ '^\s*[-+]?([0-9]+(\.[0-9]*)?|\.[0-9]+)([eE][-+]?[0-9]+)?\s*$' THEN
+        RETURN NULL;
+    END IF;
+    RETURN p_value::DOUBLE PRECISION;
+EXCEPTION
+    WHEN numeric_value_out_of_range THEN
+        -- Overflow is infinite (invalid), underflow is zero
+        RETURN CASE WHEN abs(p_value::DECIMAL) < 1 THEN 0 END;
+    WHEN OTHERS THEN
+        RETURN NULL;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
 -- ============================================================================
 -- PERFORMANCE MONITORING VIEWS
 -- ============================================================================
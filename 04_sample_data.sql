@@ -267,7 +267,9 @@ END $$;
 -- ============================================================================
 
 -- Create ETL staging table for external data feeds
-CREATE TABLE claims_staging (
+-- UNLOGGED: skips WAL on bulk ingest; contents are reconstructible from the source
+-- JSON files and are truncated after a crash
+CREATE UNLOGGED TABLE claims_staging (
     staging_id SERIAL PRIMARY KEY,
     file_name VARCHAR(200) NOT NULL,
     record_number INTEGER NOT NULL,
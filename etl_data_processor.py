@@ -5,18 +5,35 @@ Targeting: Goodroot/Navion Database Administrator Role
 Simulates processing external PBM data feeds with validation and error handling
 """
 
+import argparse
+import io
 import json
 import csv
+import ijson
+import numpy as np
 import pandas as pd
-import psycopg2
 from psycopg2.extras import execute_values
-from datetime import datetime, timedelta
+from psycopg2.pool import ThreadedConnectionPool
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 import logging
 import sys
 import os
-from typing import Dict, List, Tuple, Optional
+import threading
+from typing import Dict, Iterator, List, Tuple, Optional
 import re
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from validators_numba import (
+    CHECK_NUMERIC_IMPL, DATE_MISSING, check_numeric,
+    ERR_DATE_INVALID, ERR_DATE_FUTURE, ERR_QUANTITY_INVALID, ERR_QUANTITY_NOT_POSITIVE,
+    ERR_COST_INVALID, ERR_COST_NEGATIVE, WARN_DATE_OLD, WARN_QUANTITY_HIGH, WARN_COST_HIGH
+)
 
 # Configure logging
 logging.basicConfig(
@@ -29,85 +46,309 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Demo feeds written by PBMETLProcessor.generate_sample_files
+SAMPLE_FILES = ['sample_valid_claims.json', 'sample_invalid_claims.json']
+
+# Edge-case feed for --check-parity (type and number-format corner cases)
+PARITY_SAMPLE_FILE = 'sample_edge_case_claims.json'
+
+# External member IDs map to members.member_id via their first digit run (e.g. M000001 -> 1)
+_MEMBER_DIGITS = re.compile(r'[0-9]+')
+_MAX_MEMBER_ID = 2147483647  # members.member_id is SERIAL (int4)
+
+def _member_number(external_member_id) -> Optional[int]:
+    """Normalize an external member ID to its internal integer key (None if it has none)"""
+    match = _MEMBER_DIGITS.search(str(external_member_id))
+    if match is None:
+        return None
+    member_number = int(match.group())
+    return member_number if member_number <= _MAX_MEMBER_ID else None
+
+# NDC formats: 5-3-2, 5-4-1, 4-4-2
+_NDC_RE = re.compile(r'^(?:\d{5}-\d{3}-\d{2}|\d{5}-\d{4}-\d|\d{4}-\d{4}-\d{2})$')
+
+@lru_cache(maxsize=8192)
+def _ndc_format_ok(ndc: str) -> bool:
+    """Check NDC format; memoized since feeds repeat the same NDCs heavily"""
+    return bool(_NDC_RE.match(ndc))
+
+# ASCII digits and no trailing newline, as in the try_cast_date SQL helper
+_DATE_PARTS = r'^([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})\Z'
+
+def _parse_iso_dates(values: pd.Series) -> np.ndarray:
+    """Parse YYYY-MM-DD strings to days since 1970-01-01 (DATE_MISSING if invalid)
+
+    Works in datetime64[D] arithmetic, so the full 0001-9999 year range is
+    supported (pandas nanosecond timestamps stop at 1677/2262).
+    """
+    parts = values.astype(str).str.extract(_DATE_PARTS).to_numpy(dtype=np.float64)
+    matched = ~np.isnan(parts[:, 0])
+    year, month, day = np.nan_to_num(parts).astype(np.int64).T
+    
+    months = (year - 1970) * 12 + (month - 1)
+    month_start = months.astype('datetime64[M]').astype('datetime64[D]').astype(np.int64)
+    next_month_start = (months + 1).astype('datetime64[M]').astype('datetime64[D]').astype(np.int64)
+    days = month_start + (day - 1)
+    
+    valid = (matched & (year >= 1) & (month >= 1) & (month <= 12)
+             & (day >= 1) & (days < next_month_start))
+    return np.where(valid, days, DATE_MISSING)
+
+def _dumps_compact(value) -> str:
+    """Serialize to compact JSON text (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(',', ':'))
+
+def _format_value_for_copy(value) -> str:
+    """Format a value for COPY text format (NULL as \\N, escaped delimiters)"""
+    if value is None:
+        return '\\N'
+    return (str(value)
+            .replace('\\', '\\\\')
+            .replace('\t', '\\t')
+            .replace('\n', '\\n')
+            .replace('\r', '\\r'))
+
+@dataclass(frozen=True)
 class ValidationResult:
     """Data validation result"""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = ('is_valid', 'errors', 'warnings')
+    
     is_valid: bool
-    errors: List[str]
-    warnings: List[str]
+    errors: Tuple[str, ...]
+    warnings: Tuple[str, ...]
+
+# Shared result for the common all-clear case
+_EMPTY_RESULT = ValidationResult(True, (), ())
+
+def _validation_result(errors: List[str], warnings: List[str]) -> ValidationResult:
+    """Freeze collected messages into a result, reusing _EMPTY_RESULT when there are none"""
+    if not errors and not warnings:
+        return _EMPTY_RESULT
+    return ValidationResult(not errors, tuple(errors), tuple(warnings))
 
 class PBMDataValidator:
     """Validates incoming PBM data against business rules"""
     
+    _NPI_RE = re.compile(r'^\d{10}$')
+    
     def __init__(self, db_connection):
         self.db_connection = db_connection
-        
-    def validate_member_id(self, member_id: str) -> bool:
-        """Validate member ID exists and is active"""
+        # Reference data caches (None = not found); members keyed by normalized member number
+        self._member_status_cache: Dict[int, Optional[str]] = {}
+        self._drug_cache: Dict[str, Optional[int]] = {}
+        self._pharmacy_cache: Dict[str, Optional[Tuple[int, bool]]] = {}
+        # Reusable message buffers (a validator is only used by one thread at a time)
+        self._err_buf: List[str] = []
+        self._warn_buf: List[str] = []
+        self.prepare_statements()
+        self.sql_validation_available = self.check_sql_validation_support()
+    
+    def prepare_statements(self):
+        """Prepare the hot lookup queries once per session to skip parse/plan on each call"""
         cursor = self.db_connection.cursor()
         try:
             cursor.execute("""
+                PREPARE member_check (integer) AS
                 SELECT eligibility_status 
                 FROM members 
-                WHERE member_id = %s
-            """, (member_id,))
-            result = cursor.fetchone()
-            return result is not None and result[0] == 'active'
+                WHERE member_id = $1
+            """)
+            cursor.execute("""
+                PREPARE drug_check (text) AS
+                SELECT drug_id FROM drugs WHERE ndc_code = $1
+            """)
+            cursor.execute("""
+                PREPARE pharmacy_check (text) AS
+                SELECT pharmacy_id, pbm_network 
+                FROM pharmacies 
+                WHERE npi = $1
+            """)
+            self.db_connection.commit()
+        finally:
+            cursor.close()
+    
+    def check_sql_validation_support(self) -> bool:
+        """Check whether the set-based staging validation helpers are installed"""
+        cursor = self.db_connection.cursor()
+        try:
+            cursor.execute("""
+                SELECT to_regprocedure('try_cast_date(text)') IS NOT NULL
+                   AND to_regprocedure('try_cast_float(text)') IS NOT NULL
+            """)
+            available = cursor.fetchone()[0]
+            self.db_connection.commit()
+        finally:
+            cursor.close()
+        
+        if not available:
+            logger.warning("try_cast_date/try_cast_float not installed; validating claims in Python")
+        return available
+    
+    def preload_reference_data(self, claims_data: List[Dict], include_members: bool = True):
+        """Resolve all distinct member/NDC/NPI identifiers in a batch with one query each
+
+        include_members=False skips the member status query for callers that
+        only need drug and pharmacy IDs.
+        """
+        member_ids = set()
+        if include_members:
+            member_ids = {_member_number(c['member_id']) for c in claims_data if c.get('member_id')}
+            member_ids.discard(None)
+        ndcs = {c['ndc'] for c in claims_data if isinstance(c.get('ndc'), str)}
+        npis = {c['pharmacy_npi'] for c in claims_data if isinstance(c.get('pharmacy_npi'), str)}
+        
+        member_ids -= self._member_status_cache.keys()
+        ndcs -= self._drug_cache.keys()
+        npis -= self._pharmacy_cache.keys()
+        
+        cursor = self.db_connection.cursor()
+        try:
+            if member_ids:
+                cursor.execute("""
+                    SELECT member_id, eligibility_status 
+                    FROM members 
+                    WHERE member_id = ANY(%s::int[])
+                """, (list(member_ids),))
+                found = dict(cursor.fetchall())
+                for member_id in member_ids:
+                    self._member_status_cache[member_id] = found.get(member_id)
+            
+            if ndcs:
+                cursor.execute("SELECT ndc_code, drug_id FROM drugs WHERE ndc_code = ANY(%s)", (list(ndcs),))
+                found = dict(cursor.fetchall())
+                for ndc in ndcs:
+                    self._drug_cache[ndc] = found.get(ndc)
+            
+            if npis:
+                cursor.execute("""
+                    SELECT npi, pharmacy_id, pbm_network 
+                    FROM pharmacies 
+                    WHERE npi = ANY(%s)
+                """, (list(npis),))
+                found = {npi: (pharmacy_id, pbm_network) for npi, pharmacy_id, pbm_network in cursor.fetchall()}
+                for npi in npis:
+                    self._pharmacy_cache[npi] = found.get(npi)
         except Exception as e:
-            logger.error(f"Error validating member ID {member_id}: {e}")
-            return False
+            logger.error(f"Error preloading reference data: {e}")
+        finally:
+            cursor.close()
+    
+    def lookup_member_status(self, member_id: int) -> Optional[str]:
+        """Get member eligibility status, consulting the cache first"""
+        if member_id in self._member_status_cache:
+            return self._member_status_cache[member_id]
+        
+        cursor = self.db_connection.cursor()
+        try:
+            cursor.execute("EXECUTE member_check (%s)", (member_id,))
+            result = cursor.fetchone()
+            status = result[0] if result else None
+            self._member_status_cache[member_id] = status
+            return status
+        finally:
+            cursor.close()
+    
+    def lookup_drug(self, ndc: str) -> Optional[int]:
+        """Get drug ID for an NDC code, consulting the cache first"""
+        if ndc in self._drug_cache:
+            return self._drug_cache[ndc]
+        
+        cursor = self.db_connection.cursor()
+        try:
+            cursor.execute("EXECUTE drug_check (%s)", (ndc,))
+            result = cursor.fetchone()
+            drug_id = result[0] if result else None
+            self._drug_cache[ndc] = drug_id
+            return drug_id
+        finally:
+            cursor.close()
+    
+    def lookup_pharmacy(self, npi: str) -> Optional[Tuple[int, bool]]:
+        """Get (pharmacy_id, pbm_network) for an NPI, consulting the cache first"""
+        if npi in self._pharmacy_cache:
+            return self._pharmacy_cache[npi]
+        
+        cursor = self.db_connection.cursor()
+        try:
+            cursor.execute("EXECUTE pharmacy_check (%s)", (npi,))
+            result = cursor.fetchone()
+            pharmacy = (result[0], result[1]) if result else None
+            self._pharmacy_cache[npi] = pharmacy
+            return pharmacy
         finally:
             cursor.close()
+        
+    def validate_member_id(self, member_id: str) -> bool:
+        """Validate member ID exists and is active"""
+        member_number = _member_number(member_id)
+        if member_number is None:
+            return False
+        
+        try:
+            return self.lookup_member_status(member_number) == 'active'
+        except Exception as e:
+            logger.error("Error validating member ID %s: %s", member_id, e)
+            return False
     
     def validate_ndc_code(self, ndc: str) -> bool:
         """Validate NDC code format and existence"""
-        # Check NDC format (multiple valid formats)
-        ndc_patterns = [
-            r'^\d{5}-\d{3}-\d{2}$',  # 5-3-2
-            r'^\d{5}-\d{4}-\d{1}$',  # 5-4-1  
-            r'^\d{4}-\d{4}-\d{2}$'   # 4-4-2
-        ]
-        
-        format_valid = any(re.match(pattern, ndc) for pattern in ndc_patterns)
-        if not format_valid:
+        # Check NDC format (multiple valid formats); NDCs must be JSON strings
+        if not isinstance(ndc, str) or not _ndc_format_ok(ndc):
             return False
         
         # Check if NDC exists in drugs table
-        cursor = self.db_connection.cursor()
         try:
-            cursor.execute("SELECT 1 FROM drugs WHERE ndc_code = %s", (ndc,))
-            return cursor.fetchone() is not None
+            return self.lookup_drug(ndc) is not None
         except Exception as e:
-            logger.error(f"Error validating NDC {ndc}: {e}")
+            logger.error("Error validating NDC %s: %s", ndc, e)
             return False
-        finally:
-            cursor.close()
     
     def validate_pharmacy_npi(self, npi: str) -> bool:
         """Validate pharmacy NPI format and network status"""
-        # NPI should be 10 digits
-        if not re.match(r'^\d{10}$', npi):
+        # NPI should be a string of 10 digits
+        if not isinstance(npi, str) or not self._NPI_RE.match(npi):
             return False
         
-        cursor = self.db_connection.cursor()
         try:
-            cursor.execute("""
-                SELECT pbm_network 
-                FROM pharmacies 
-                WHERE npi = %s
-            """, (npi,))
-            result = cursor.fetchone()
-            return result is not None and result[0] is True
+            pharmacy = self.lookup_pharmacy(npi)
+            return pharmacy is not None and pharmacy[1] is True
         except Exception as e:
-            logger.error(f"Error validating pharmacy NPI {npi}: {e}")
+            logger.error("Error validating pharmacy NPI %s: %s", npi, e)
             return False
-        finally:
-            cursor.close()
     
-    def validate_claim_data(self, claim_data: Dict) -> ValidationResult:
+    def check_numeric_batch(self, claims_data: List[Dict]) -> List[Tuple[int, int]]:
+        """Vectorized numeric range checks over a batch of claims
+
+        Columns are parsed with pandas/NumPy and handed to check_numeric (Numba
+        JIT, or NumPy when Numba is unavailable); returns one (errors, warnings)
+        bitmask pair per claim for validate_claim_data.
+        """
+        if not claims_data:
+            return []
+        
+        df = pd.DataFrame.from_records(claims_data, columns=['quantity', 'cost', 'date_filled'])
+        quantity = pd.to_numeric(df['quantity'], errors='coerce').to_numpy(dtype=np.float64)
+        cost = pd.to_numeric(df['cost'], errors='coerce').to_numpy(dtype=np.float64)
+        # Treat inf/-inf like unparseable values (to_numpy may hand back a
+        # read-only view under copy-on-write, so build new arrays)
+        quantity = np.where(np.isfinite(quantity), quantity, np.nan)
+        cost = np.where(np.isfinite(cost), cost, np.nan)
+        date_days = _parse_iso_dates(df['date_filled'])
+        today_days = (date.today() - date(1970, 1, 1)).days
+        
+        errors, warnings = check_numeric(quantity, cost, date_days, today_days)
+        return list(zip(errors.tolist(), warnings.tolist()))
+    
+    def validate_claim_data(self, claim_data: Dict,
+                            numeric_flags: Optional[Tuple[int, int]] = None) -> ValidationResult:
         """Comprehensive claim data validation"""
-        errors = []
-        warnings = []
+        errors = self._err_buf
+        warnings = self._warn_buf
+        errors.clear()
+        warnings.clear()
         
         # Required fields check
         required_fields = ['member_id', 'ndc', 'pharmacy_npi', 'date_filled', 'quantity', 'cost']
@@ -116,7 +357,7 @@ class PBMDataValidator:
                 errors.append(f"Missing required field: {field}")
         
         if errors:  # Don't continue validation if required fields missing
-            return ValidationResult(False, errors, warnings)
+            return _validation_result(errors, warnings)
         
         # Member ID validation
         if not self.validate_member_id(claim_data['member_id']):
@@ -130,62 +371,142 @@ class PBMDataValidator:
         if not self.validate_pharmacy_npi(claim_data['pharmacy_npi']):
             errors.append(f"Invalid or out-of-network pharmacy NPI: {claim_data['pharmacy_npi']}")
         
+        if numeric_flags is None:
+            # Single-claim callers go through the same batch checks
+            numeric_flags = self.check_numeric_batch([claim_data])[0]
+        
+        error_bits, warning_bits = numeric_flags
+        
         # Date validation
-        try:
-            fill_date = datetime.strptime(claim_data['date_filled'], '%Y-%m-%d').date()
-            if fill_date > datetime.now().date():
-                errors.append("Fill date cannot be in the future")
-            elif fill_date < datetime.now().date() - timedelta(days=365):
-                warnings.append("Fill date is more than 1 year old")
-        except ValueError:
+        if error_bits & ERR_DATE_INVALID:
             errors.append(f"Invalid date format: {claim_data['date_filled']}")
+        elif error_bits & ERR_DATE_FUTURE:
+            errors.append("Fill date cannot be in the future")
+        elif warning_bits & WARN_DATE_OLD:
+            warnings.append("Fill date is more than 1 year old")
         
         # Quantity validation
-        try:
-            quantity = float(claim_data['quantity'])
-            if quantity <= 0:
-                errors.append("Quantity must be positive")
-            elif quantity > 1000:
-                warnings.append("Unusually high quantity dispensed")
-        except ValueError:
+        if error_bits & ERR_QUANTITY_INVALID:
             errors.append(f"Invalid quantity: {claim_data['quantity']}")
+        elif error_bits & ERR_QUANTITY_NOT_POSITIVE:
+            errors.append("Quantity must be positive")
+        elif warning_bits & WARN_QUANTITY_HIGH:
+            warnings.append("Unusually high quantity dispensed")
         
         # Cost validation
-        try:
-            cost = float(claim_data['cost'])
-            if cost < 0:
-                errors.append("Cost cannot be negative")
-            elif cost > 50000:
-                warnings.append("Unusually high cost - potential specialty drug")
-        except ValueError:
+        if error_bits & ERR_COST_INVALID:
             errors.append(f"Invalid cost: {claim_data['cost']}")
+        elif error_bits & ERR_COST_NEGATIVE:
+            errors.append("Cost cannot be negative")
+        elif warning_bits & WARN_COST_HIGH:
+            warnings.append("Unusually high cost - potential specialty drug")
         
-        return ValidationResult(len(errors) == 0, errors, warnings)
+        return _validation_result(errors, warnings)
 
 class PBMETLProcessor:
     """Main ETL processor for PBM data feeds"""
     
+    # Rows per multi-row INSERT into claims_staging
+    STAGING_PAGE_SIZE = 500
+    
+    # Upper bound on pooled connections / concurrent file workers
+    MAX_WORKERS = 8
+    
     def __init__(self, db_config: Dict[str, str]):
         self.db_config = db_config
-        self.connection = None
-        self.validator = None
+        self.pool = None
+        # One validator per pooled connection (prepared statements are per-session)
+        self.validators: Dict[object, PBMDataValidator] = {}
+        self.validators_lock = threading.Lock()
         
     def connect_to_database(self):
-        """Establish database connection"""
+        """Establish database connection pool"""
         try:
-            self.connection = psycopg2.connect(**self.db_config)
-            self.connection.autocommit = False
-            self.validator = PBMDataValidator(self.connection)
-            logger.info("Database connection established")
+            # Ingest connections use asynchronous commit; staging data can be reloaded from source files
+            pool_config = dict(self.db_config)
+            pool_config['options'] = ' '.join(
+                filter(None, [pool_config.get('options'), '-c synchronous_commit=off'])
+            )
+            self.pool = ThreadedConnectionPool(1, self.MAX_WORKERS, **pool_config)
+            logger.info("Database connection pool established")
+            logger.info("Numeric claim checks using %s implementation", CHECK_NUMERIC_IMPL)
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
             raise
     
     def close_connection(self):
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
-            logger.info("Database connection closed")
+        """Close all pooled database connections"""
+        if self.pool:
+            self.pool.closeall()
+            logger.info("Database connection pool closed")
+    
+    def get_validator(self, connection) -> PBMDataValidator:
+        """Get (or create) the validator bound to a pooled connection"""
+        with self.validators_lock:
+            validator = self.validators.get(connection)
+        if validator is not None:
+            return validator
+        
+        # Built outside the lock: PREPARE round-trips shouldn't serialize other workers
+        connection.autocommit = False
+        validator = PBMDataValidator(connection)
+        
+        with self.validators_lock:
+            # Drop validators for connections the pool has since closed
+            for stale in [conn for conn in self.validators if conn.closed]:
+                del self.validators[stale]
+            return self.validators.setdefault(connection, validator)
+    
+    def iter_claim_batches(self, file) -> Iterator[List[Dict]]:
+        """Stream claim objects from a JSON file opened in binary mode, in batches of STAGING_PAGE_SIZE"""
+        # Skip a UTF-8 byte order mark (ijson rejects it)
+        start = 3 if file.read(3) == b'\xef\xbb\xbf' else 0
+        file.seek(start)
+        
+        # Peek at the first significant byte to tell arrays from single objects
+        first_byte = b''
+        while True:
+            first_byte = file.read(1)
+            if not first_byte or not first_byte.isspace():
+                break
+        file.seek(start)
+        
+        if first_byte == b'[':
+            claims = self._iter_array_items(file)
+        else:
+            # Single object (or empty file): small enough to load eagerly
+            data = json.load(file)
+            claims = iter(data if isinstance(data, list) else [data])
+        
+        batch = []
+        for claim_data in claims:
+            batch.append(claim_data)
+            if len(batch) >= self.STAGING_PAGE_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    def _iter_array_items(self, file) -> Iterator[Dict]:
+        """Stream the elements of a top-level JSON array with ijson
+
+        The C backend rejects integers wider than 64 bits; on that error parsing
+        restarts on the pure-Python backend, skipping the items already yielded.
+        """
+        start = file.tell()
+        item_count = 0
+        try:
+            for item in ijson.items(file, 'item', use_float=True):
+                yield item
+                item_count += 1
+        except ijson.JSONError as e:
+            if 'integer overflow' not in str(e):
+                raise
+            logger.warning("Integer too large for the %s JSON parser; continuing with the Python backend",
+                           ijson.backend)
+            file.seek(start)
+            python_items = ijson.get_backend('python').items(file, 'item', use_float=True)
+            yield from islice(python_items, item_count, None)
     
     def process_json_file(self, file_path: str) -> Tuple[int, int, int]:
         """Process JSON file containing claim data"""
@@ -194,124 +515,385 @@ class PBMETLProcessor:
         valid_records = 0
         invalid_records = 0
         processed_records = 0
+        cursor = None
+        connection = self.pool.getconn()
         
         try:
-            with open(file_path, 'r') as file:
-                data = json.load(file)
-                
-            # Handle both single objects and arrays
-            claims_data = data if isinstance(data, list) else [data]
+            validator = self.get_validator(connection)
+            cursor = connection.cursor()
+            # Single ingest transaction per file without waiting on WAL flush at commit
+            cursor.execute("SET LOCAL synchronous_commit = off")
+            file_name = os.path.basename(file_path)
+            staging_rows = []
+            valid_claims = []
+            record_count = 0
             
-            cursor = self.connection.cursor()
-            
-            for i, claim_data in enumerate(claims_data, 1):
-                try:
-                    # Validate claim data
-                    validation_result = self.validator.validate_claim_data(claim_data)
-                    
-                    # Insert into staging table
-                    status = 'valid' if validation_result.is_valid else 'invalid'
-                    error_messages = validation_result.errors + validation_result.warnings
+            with open(file_path, 'rb') as file:
+                # Handle both single objects and arrays, parsing lazily batch by batch
+                for claims_data in self.iter_claim_batches(file):
+                    first_record = record_count + 1
+                    record_count += len(claims_data)
                     
-                    cursor.execute("""
-                        INSERT INTO claims_staging (
-                            file_name, record_number, raw_data, 
-                            validation_status, error_messages
-                        ) VALUES (%s, %s, %s, %s, %s)
-                    """, (
-                        os.path.basename(file_path),
-                        i,
-                        json.dumps(claim_data),
-                        status,
-                        error_messages if error_messages else None
-                    ))
-                    
-                    if validation_result.is_valid:
-                        valid_records += 1
-                        # Process valid claims into main tables
-                        self.process_valid_claim(claim_data, cursor)
-                        processed_records += 1
+                    if validator.sql_validation_available:
+                        # Stage raw rows as pending, then validate them set-based in the database
+                        for offset, claim_data in enumerate(claims_data):
+                            staging_rows.append((
+                                file_name,
+                                first_record + offset,
+                                _dumps_compact(claim_data),
+                                'pending',
+                                None
+                            ))
+                        staging_ids = self.flush_staging_rows(staging_rows, cursor)
+                        
+                        for record_number, status, error_messages in self.validate_staging_in_sql(staging_ids, cursor):
+                            if status == 'valid':
+                                valid_records += 1
+                                valid_claims.append(claims_data[record_number - first_record])
+                            else:
+                                invalid_records += 1
+                                logger.warning("Invalid record %d: %s", record_number, error_messages)
                     else:
-                        invalid_records += 1
-                        logger.warning(f"Invalid record {i}: {validation_result.errors}")
-                
-                except Exception as e:
-                    logger.error(f"Error processing record {i}: {e}")
-                    invalid_records += 1
+                        # Fallback: validate each claim in Python before staging
+                        self.validate_batch_in_python(claims_data, first_record, file_name,
+                                                      validator, staging_rows, valid_claims)
+                        self.flush_staging_rows(staging_rows, cursor)
+                        batch_valid = len(valid_claims)
+                        valid_records += batch_valid
+                        invalid_records += len(claims_data) - batch_valid
+                    
+                    processed_records += self.bulk_process_valid_claims(valid_claims, cursor, validator)
+                    valid_claims.clear()
             
-            self.connection.commit()
+            connection.commit()
             logger.info(f"File processing complete: {valid_records} valid, {invalid_records} invalid, {processed_records} processed")
             
         except Exception as e:
             logger.error(f"Error processing file {file_path}: {e}")
-            if self.connection:
-                self.connection.rollback()
+            connection.rollback()
             raise
         finally:
             if cursor:
                 cursor.close()
+            self.pool.putconn(connection)
         
         return valid_records, invalid_records, processed_records
     
-    def process_valid_claim(self, claim_data: Dict, cursor):
-        """Process validated claim into main claims table"""
+    def validate_batch_in_python(self, claims_data: List[Dict], first_record: int, file_name: str,
+                                 validator: PBMDataValidator, staging_rows: List[Tuple],
+                                 valid_claims: List[Dict]):
+        """Validate a batch claim by claim, queueing staging rows and valid claims"""
+        # Resolve reference data for the whole batch up front
+        validator.preload_reference_data(claims_data)
+        numeric_flags = validator.check_numeric_batch(claims_data)
+        
+        for record_number, (claim_data, claim_flags) in enumerate(zip(claims_data, numeric_flags), first_record):
+            try:
+                # Validate claim data
+                validation_result = validator.validate_claim_data(claim_data, claim_flags)
+                
+                # Queue row for the staging table
+                status = 'valid' if validation_result.is_valid else 'invalid'
+                error_messages = list(validation_result.errors + validation_result.warnings)
+                
+                staging_rows.append((
+                    file_name,
+                    record_number,
+                    _dumps_compact(claim_data),
+                    status,
+                    error_messages if error_messages else None
+                ))
+                
+                if validation_result.is_valid:
+                    # Queue valid claims for set-based processing into main tables
+                    valid_claims.append(claim_data)
+                else:
+                    logger.warning("Invalid record %d: %s", record_number, validation_result.errors)
+            
+            except Exception as e:
+                logger.error("Error processing record %d: %s", record_number, e)
+    
+    def flush_staging_rows(self, staging_rows: List[Tuple], cursor) -> List[int]:
+        """Bulk insert queued staging rows with a multi-row VALUES statement
+
+        Returns the staging_id of each inserted row.
+        """
+        if not staging_rows:
+            return []
+        inserted = execute_values(cursor, """
+            INSERT INTO claims_staging (
+                file_name, record_number, raw_data, 
+                validation_status, error_messages
+            ) VALUES %s
+            RETURNING staging_id
+        """, staging_rows, page_size=self.STAGING_PAGE_SIZE, fetch=True)
+        staging_rows.clear()
+        return [row[0] for row in inserted]
+    
+    def bulk_process_valid_claims(self, claims: List[Dict], cursor, validator: PBMDataValidator) -> int:
+        """COPY validated claims into a temp table and run process_claim set-based"""
+        if not claims:
+            return 0
+        
         try:
-            # Get database IDs from external identifiers
-            member_id = self.get_member_id(claim_data['member_id'], cursor)
-            drug_id = self.get_drug_id(claim_data['ndc'], cursor)
-            pharmacy_id = self.get_pharmacy_id(claim_data['pharmacy_npi'], cursor)
+            # Drug/pharmacy IDs for the batch (member IDs come from the external ID itself)
+            validator.preload_reference_data(claims, include_members=False)
             
-            # Use the process_claim stored procedure
-            cursor.execute("""
-                SELECT * FROM process_claim(
-                    %s, %s, %s, %s, %s, %s, 
-                    %s, %s, %s, %s, %s
+            buf = io.StringIO()
+            etl_date = datetime.now().strftime('%Y%m%d')
+            for claim_data in claims:
+                # Get database IDs from external identifiers
+                member_id = self.get_member_id(claim_data['member_id'], cursor)
+                drug_id = self.get_drug_id(claim_data['ndc'], validator)
+                pharmacy_id = self.get_pharmacy_id(claim_data['pharmacy_npi'], validator)
+                cost = float(claim_data['cost'])
+                
+                row = (
+                    member_id,
+                    drug_id,
+                    pharmacy_id,
+                    claim_data.get('prescription_number', f"ETL-{etl_date}-{member_id}"),
+                    claim_data.get('date_prescribed', claim_data['date_filled']),
+                    claim_data['date_filled'],
+                    claim_data.get('days_supply', 30),
+                    float(claim_data['quantity']),
+                    claim_data.get('prescriber_npi', '9999999999'),
+                    cost * 0.9,  # Assume 90% is ingredient cost
+                    cost * 0.1   # Assume 10% is dispensing fee
                 )
-            """, (
-                member_id,
-                drug_id, 
-                pharmacy_id,
-                claim_data.get('prescription_number', f"ETL-{datetime.now().strftime('%Y%m%d')}-{member_id}"),
-                claim_data.get('date_prescribed', claim_data['date_filled']),
-                claim_data['date_filled'],
-                claim_data.get('days_supply', 30),
-                float(claim_data['quantity']),
-                claim_data.get('prescriber_npi', '9999999999'),
-                float(claim_data['cost']) * 0.9,  # Assume 90% is ingredient cost
-                float(claim_data['cost']) * 0.1   # Assume 10% is dispensing fee
-            ))
+                buf.write('\t'.join(_format_value_for_copy(value) for value in row))
+                buf.write('\n')
+            buf.seek(0)
             
-            result = cursor.fetchone()
-            if result:
-                claim_id, status, copay, plan_paid, rejection_code, rejection_desc = result
-                logger.info(f"Claim processed: ID={claim_id}, Status={status}")
+            # Temp table lives for the current transaction only
+            cursor.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS tmp_claims (
+                    row_seq SERIAL,
+                    member_id INTEGER,
+                    drug_id INTEGER,
+                    pharmacy_id INTEGER,
+                    rx_no TEXT,
+                    date_prescribed DATE,
+                    date_filled DATE,
+                    days_supply INTEGER,
+                    quantity DECIMAL,
+                    prescriber_npi TEXT,
+                    ingredient_cost DECIMAL,
+                    dispensing_fee DECIMAL
+                ) ON COMMIT DROP
+            """)
+            cursor.execute("TRUNCATE tmp_claims")
+            cursor.copy_expert("""
+                COPY tmp_claims (
+                    member_id, drug_id, pharmacy_id, rx_no, date_prescribed, date_filled,
+                    days_supply, quantity, prescriber_npi, ingredient_cost, dispensing_fee
+                ) FROM STDIN WITH (FORMAT text)
+            """, buf)
+            
+            # Run the process_claim business logic once per staged row in a single statement
+            cursor.execute("""
+                SELECT r.claim_id, r.claim_status
+                FROM tmp_claims t
+                CROSS JOIN LATERAL process_claim(
+                    t.member_id, t.drug_id, t.pharmacy_id, t.rx_no, t.date_prescribed,
+                    t.date_filled, t.days_supply, t.quantity, t.prescriber_npi,
+                    t.ingredient_cost, t.dispensing_fee
+                ) r
+                ORDER BY t.row_seq
+            """)
+            results = cursor.fetchall()
+            if logger.isEnabledFor(logging.DEBUG):
+                for claim_id, status in results:
+                    logger.debug("Claim processed: ID=%s, Status=%s", claim_id, status)
+            
+            return len(results)
                 
         except Exception as e:
-            logger.error(f"Error processing valid claim: {e}")
+            logger.error(f"Error bulk processing valid claims: {e}")
             raise
     
+    def validate_staging_in_sql(self, staging_ids: List[int], cursor) -> List[Tuple[int, str, Optional[List[str]]]]:
+        """Validate pending staging rows with one set-based UPDATE
+
+        Joins claims_staging to members/drugs/pharmacies and applies the
+        validate_claim_data rules, writing validation_status and error_messages.
+        Returns (record_number, validation_status, error_messages) in record order.
+        """
+        if not staging_ids:
+            return []
+        
+        cursor.execute(r"""
+            WITH parsed AS (
+                SELECT 
+                    s.staging_id,
+                    s.raw_data->>'member_id' AS member_id,
+                    s.raw_data->>'ndc' AS ndc,
+                    s.raw_data->>'pharmacy_npi' AS npi,
+                    s.raw_data->>'date_filled' AS date_filled,
+                    s.raw_data->>'quantity' AS quantity_raw,
+                    s.raw_data->>'cost' AS cost_raw,
+                    -- Same normalization as _member_number: first digit run, within int4
+                    CASE WHEN md.digits ~ '^\d{1,10}$' THEN
+                        CASE WHEN md.digits::BIGINT <= 2147483647 THEN md.digits::INTEGER END
+                    END AS member_number,
+                    try_cast_date(s.raw_data->>'date_filled') AS fill_date,
+                    -- Numbers parse as Python floats do; JSON true/false count as 1/0
+                    CASE jsonb_typeof(s.raw_data->'quantity')
+                        WHEN 'boolean' THEN (s.raw_data->>'quantity')::BOOLEAN::INTEGER
+                        ELSE try_cast_float(s.raw_data->>'quantity')
+                    END AS quantity,
+                    CASE jsonb_typeof(s.raw_data->'cost')
+                        WHEN 'boolean' THEN (s.raw_data->>'cost')::BOOLEAN::INTEGER
+                        ELSE try_cast_float(s.raw_data->>'cost')
+                    END AS cost,
+                    -- NDC and NPI must be JSON strings (numbers are rejected, as in Python)
+                    jsonb_typeof(s.raw_data->'ndc') = 'string' AS ndc_is_string,
+                    jsonb_typeof(s.raw_data->'pharmacy_npi') = 'string' AS npi_is_string,
+                    -- Required fields must be present and truthy (as in Python: not 0, '', false, null, [], {})
+                    ARRAY(
+                        SELECT 'Missing required field: ' || rf.field
+                        FROM unnest(ARRAY['member_id', 'ndc', 'pharmacy_npi', 'date_filled', 'quantity', 'cost'])
+                            WITH ORDINALITY AS rf(field, ord)
+                        WHERE COALESCE(s.raw_data->rf.field, 'null'::JSONB)
+                            IN ('null', 'false', '0', '""', '[]', '{}')
+                        ORDER BY rf.ord
+                    ) AS missing
+                FROM claims_staging s
+                CROSS JOIN LATERAL (
+                    SELECT CASE 
+                        WHEN substring(s.raw_data->>'member_id' FROM '[0-9]+') IS NOT NULL
+                        THEN COALESCE(NULLIF(ltrim(substring(s.raw_data->>'member_id' FROM '[0-9]+'), '0'), ''), '0')
+                    END AS digits
+                ) md
+                WHERE s.staging_id = ANY(%s)
+                  AND s.validation_status = 'pending'
+            ),
+            checks AS (
+                SELECT 
+                    p.*,
+                    COALESCE(m.eligibility_status = 'active', false) AS member_ok,
+                    p.ndc_is_string
+                        AND p.ndc ~ '^(\d{5}-\d{3}-\d{2}|\d{5}-\d{4}-\d|\d{4}-\d{4}-\d{2})$'
+                        AND d.drug_id IS NOT NULL AS drug_ok,
+                    p.npi_is_string AND p.npi ~ '^\d{10}$' AND ph.pbm_network IS TRUE AS pharmacy_ok
+                FROM parsed p
+                LEFT JOIN members m ON m.member_id = p.member_number
+                LEFT JOIN drugs d ON d.ndc_code = p.ndc
+                LEFT JOIN pharmacies ph ON ph.npi = p.npi
+            ),
+            v AS (
+                SELECT 
+                    staging_id,
+                    CASE WHEN cardinality(missing) > 0 THEN missing ELSE ARRAY_REMOVE(ARRAY[
+                        CASE WHEN NOT member_ok THEN 'Invalid or inactive member ID: ' || member_id END,
+                        CASE WHEN NOT drug_ok THEN 'Invalid NDC code: ' || ndc END,
+                        CASE WHEN NOT pharmacy_ok THEN 'Invalid or out-of-network pharmacy NPI: ' || npi END,
+                        CASE 
+                            WHEN fill_date IS NULL THEN 'Invalid date format: ' || date_filled
+                            WHEN fill_date > CURRENT_DATE THEN 'Fill date cannot be in the future'
+                        END,
+                        CASE 
+                            WHEN quantity IS NULL THEN 'Invalid quantity: ' || quantity_raw
+                            WHEN quantity <= 0 THEN 'Quantity must be positive'
+                        END,
+                        CASE 
+                            WHEN cost IS NULL THEN 'Invalid cost: ' || cost_raw
+                            WHEN cost < 0 THEN 'Cost cannot be negative'
+                        END
+                    ], NULL) END AS errors,
+                    CASE WHEN cardinality(missing) > 0 THEN ARRAY[]::TEXT[] ELSE ARRAY_REMOVE(ARRAY[
+                        CASE WHEN fill_date < CURRENT_DATE - 365 THEN 'Fill date is more than 1 year old' END,
+                        CASE WHEN quantity > 1000 THEN 'Unusually high quantity dispensed' END,
+                        CASE WHEN cost > 50000 THEN 'Unusually high cost - potential specialty drug' END
+                    ], NULL) END AS warnings
+                FROM checks
+            )
+            UPDATE claims_staging s
+            SET validation_status = CASE WHEN cardinality(v.errors) = 0 THEN 'valid' ELSE 'invalid' END,
+                error_messages = NULLIF(v.errors || v.warnings, ARRAY[]::TEXT[])
+            FROM v
+            WHERE s.staging_id = v.staging_id
+            RETURNING s.record_number, s.validation_status, s.error_messages
+        """, (staging_ids,))
+        return sorted(cursor.fetchall())
+    
+    def check_validation_parity(self, file_path: str) -> List[Tuple[int, List[str], List[str]]]:
+        """Validate a feed with both validate_claim_data and validate_staging_in_sql
+
+        Returns (record_number, python_messages, sql_messages) for every record the
+        two paths disagree on. The staging rows are rolled back afterwards.
+        """
+        mismatches = []
+        cursor = None
+        connection = self.pool.getconn()
+        
+        try:
+            validator = self.get_validator(connection)
+            if not validator.sql_validation_available:
+                raise RuntimeError("SQL validation helpers are not installed")
+            cursor = connection.cursor()
+            file_name = os.path.basename(file_path)
+            staging_rows = []
+            record_count = 0
+            
+            with open(file_path, 'rb') as file:
+                for claims_data in self.iter_claim_batches(file):
+                    first_record = record_count + 1
+                    record_count += len(claims_data)
+                    
+                    validator.preload_reference_data(claims_data)
+                    numeric_flags = validator.check_numeric_batch(claims_data)
+                    python_results = {}
+                    for offset, claim_data in enumerate(claims_data):
+                        record_number = first_record + offset
+                        try:
+                            result = validator.validate_claim_data(claim_data, numeric_flags[offset])
+                            python_results[record_number] = (
+                                'valid' if result.is_valid else 'invalid',
+                                list(result.errors + result.warnings)
+                            )
+                        except Exception as e:
+                            python_results[record_number] = ('error', [str(e)])
+                        staging_rows.append((file_name, record_number, _dumps_compact(claim_data), 'pending', None))
+                    staging_ids = self.flush_staging_rows(staging_rows, cursor)
+                    
+                    for record_number, status, error_messages in self.validate_staging_in_sql(staging_ids, cursor):
+                        python_status, python_messages = python_results[record_number]
+                        sql_messages = error_messages or []
+                        if python_status != status or python_messages != sql_messages:
+                            mismatches.append((record_number, python_messages, sql_messages))
+        finally:
+            if cursor:
+                cursor.close()
+            connection.rollback()
+            self.pool.putconn(connection)
+        
+        return mismatches
+    
     def get_member_id(self, external_member_id: str, cursor) -> int:
         """Get internal member ID from external identifier"""
         # For demo purposes, extract numeric part of member ID
-        member_num = re.findall(r'\d+', external_member_id)
-        if member_num:
-            return int(member_num[0])
+        member_number = _member_number(external_member_id)
+        if member_number is not None:
+            return member_number
         return 1  # Default fallback
     
-    def get_drug_id(self, ndc_code: str, cursor) -> int:
+    def get_drug_id(self, ndc_code: str, validator: PBMDataValidator) -> int:
         """Get drug ID from NDC code"""
-        cursor.execute("SELECT drug_id FROM drugs WHERE ndc_code = %s", (ndc_code,))
-        result = cursor.fetchone()
-        return result[0] if result else 1
+        drug_id = validator.lookup_drug(ndc_code)
+        return drug_id if drug_id is not None else 1
     
-    def get_pharmacy_id(self, npi: str, cursor) -> int:
+    def get_pharmacy_id(self, npi: str, validator: PBMDataValidator) -> int:
         """Get pharmacy ID from NPI"""
-        cursor.execute("SELECT pharmacy_id FROM pharmacies WHERE npi = %s", (npi,))
-        result = cursor.fetchone()
-        return result[0] if result else 1
+        pharmacy = validator.lookup_pharmacy(npi)
+        return pharmacy[0] if pharmacy else 1
     
-    def generate_sample_files(self):
-        """Generate sample JSON files for testing"""
+    def generate_sample_files(self, force: bool = False):
+        """Generate sample JSON files for testing (skipped if they already exist unless forced)"""
+        if not force and all(os.path.exists(path) for path in SAMPLE_FILES + [PARITY_SAMPLE_FILE]):
+            logger.info("Sample ETL files already present, skipping generation")
+            return
+        
         logger.info("Generating sample ETL files...")
         
         # Sample valid claims
@@ -364,20 +946,41 @@ class PBMETLProcessor:
             }
         ]
         
+        # Corner cases where Python and SQL validation must agree (see check_validation_parity)
+        base_claim = valid_claims[2]
+        edge_case_claims = [
+            dict(base_claim, quantity=True),                     # JSON true counts as 1
+            dict(base_claim, quantity=" 30 ", cost="1e-400"),    # whitespace; cost underflows to 0
+            dict(base_claim, cost="1e400"),                      # overflows a float
+            dict(base_claim, cost="NaN"),
+            dict(base_claim, quantity="1_000"),
+            dict(base_claim, quantity="1e-400"),                 # underflows to 0
+            dict(base_claim, quantity=0),
+            dict(base_claim, pharmacy_npi=1234567897),           # NPI must be a string
+            dict(base_claim, ndc=93005801),                      # NDC must be a string
+            dict(base_claim, member_id="M0000000006"),
+            dict(base_claim, date_filled="2024-03-15\n"),
+        ]
+        
         # Write sample files
         with open('sample_valid_claims.json', 'w') as f:
-            json.dump(valid_claims, f, indent=2)
+            f.write(_dumps_compact(valid_claims))
         
         with open('sample_invalid_claims.json', 'w') as f:
-            json.dump(invalid_claims, f, indent=2)
+            f.write(_dumps_compact(invalid_claims))
+        
+        with open(PARITY_SAMPLE_FILE, 'w') as f:
+            f.write(_dumps_compact(edge_case_claims))
         
-        logger.info("Sample files generated: sample_valid_claims.json, sample_invalid_claims.json")
+        logger.info("Sample files generated: sample_valid_claims.json, sample_invalid_claims.json, %s",
+                    PARITY_SAMPLE_FILE)
     
     def run_data_quality_report(self):
         """Run data quality checks and generate report"""
         logger.info("Running data quality checks...")
         
-        cursor = self.connection.cursor()
+        connection = self.pool.getconn()
+        cursor = connection.cursor()
         try:
             cursor.execute("SELECT * FROM run_data_quality_checks()")
             results = cursor.fetchall()
@@ -397,12 +1000,15 @@ class PBMETLProcessor:
             logger.error(f"Error running data quality checks: {e}")
         finally:
             cursor.close()
+            connection.rollback()
+            self.pool.putconn(connection)
     
     def generate_etl_summary_report(self):
         """Generate ETL processing summary"""
         logger.info("Generating ETL summary report...")
         
-        cursor = self.connection.cursor()
+        connection = self.pool.getconn()
+        cursor = connection.cursor()
         try:
             # Staging table summary
             cursor.execute("""
@@ -444,9 +1050,27 @@ class PBMETLProcessor:
             logger.error(f"Error generating ETL summary: {e}")
         finally:
             cursor.close()
+            connection.rollback()
+            self.pool.putconn(connection)
+    
+    def process_files(self, file_paths: List[str]) -> List[Tuple[int, int, int]]:
+        """Process several JSON files concurrently, one pooled connection per worker"""
+        workers = min(self.MAX_WORKERS, len(file_paths)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.process_json_file, file_paths))
 
 def main():
     """Main ETL execution function"""
+    parser = argparse.ArgumentParser(description="Process PBM claim JSON feeds")
+    parser.add_argument('files', nargs='*',
+                        help="JSON feed files to process (default: the generated sample files)")
+    parser.add_argument('--generate-samples', action='store_true',
+                        help="Regenerate the sample JSON files even if they already exist")
+    parser.add_argument('--check-parity', action='store_true',
+                        help="Validate the files (default: the sample files) in both Python and SQL "
+                             "and report records where they disagree, without loading anything")
+    args = parser.parse_args()
+    
     # Database configuration (would normally come from environment variables)
     db_config = {
         'host': 'localhost',
@@ -462,17 +1086,44 @@ def main():
         # Connect to database
         processor.connect_to_database()
         
-        # Generate sample files for demonstration
-        processor.generate_sample_files()
-        
-        # Process sample files
-        print("Processing valid claims file...")
-        valid_count, invalid_count, processed_count = processor.process_json_file('sample_valid_claims.json')
-        print(f"Valid claims processed: {processed_count}/{valid_count}")
+        if args.check_parity:
+            if args.files:
+                parity_files = args.files
+            else:
+                processor.generate_sample_files(force=args.generate_samples)
+                parity_files = SAMPLE_FILES + [PARITY_SAMPLE_FILE]
+            
+            mismatch_count = 0
+            for file_path in parity_files:
+                mismatches = processor.check_validation_parity(file_path)
+                mismatch_count += len(mismatches)
+                print(f"{file_path}: {len(mismatches)} validation mismatches")
+                for record_number, python_messages, sql_messages in mismatches:
+                    print(f"  Record {record_number}:")
+                    print(f"    Python: {python_messages}")
+                    print(f"    SQL:    {sql_messages}")
+            if mismatch_count:
+                sys.exit(1)
+            return
         
-        print("\nProcessing invalid claims file...")
-        valid_count, invalid_count, processed_count = processor.process_json_file('sample_invalid_claims.json')
-        print(f"Invalid claims found: {invalid_count}")
+        if args.files:
+            # Process the given feed files in parallel
+            results = processor.process_files(args.files)
+            for file_path, (valid_count, invalid_count, processed_count) in zip(args.files, results):
+                print(f"{file_path}: {valid_count} valid, {invalid_count} invalid, {processed_count} processed")
+        else:
+            # Generate sample files for demonstration (only when missing or requested)
+            processor.generate_sample_files(force=args.generate_samples)
+            
+            # Process sample files in parallel
+            print("Processing valid and invalid claims files...")
+            valid_file_counts, invalid_file_counts = processor.process_files(SAMPLE_FILES)
+            
+            valid_count, invalid_count, processed_count = valid_file_counts
+            print(f"Valid claims processed: {processed_count}/{valid_count}")
+            
+            valid_count, invalid_count, processed_count = invalid_file_counts
+            print(f"Invalid claims found: {invalid_count}")
         
         # Generate reports
         processor.run_data_quality_report()
@@ -0,0 +1,9 @@
+-- Convert the ETL staging table to UNLOGGED for existing databases
+
+-- Staging rows are reconstructible from the source JSON feeds, so skip WAL
+-- writes during bulk ingest. Note: an UNLOGGED table is truncated after a crash
+-- and is not replicated to standbys.
+ALTER TABLE claims_staging SET UNLOGGED;
+
+-- Add comment
+COMMENT ON TABLE claims_staging IS 'UNLOGGED ETL staging area for external PBM data feeds; reload from source files after a crash';
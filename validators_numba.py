@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Numba-compiled numeric checks for PBM claim validation
+Range checks on quantity, cost and fill date run over whole batches as arrays
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Error bits
+ERR_DATE_INVALID = 1
+ERR_DATE_FUTURE = 2
+ERR_QUANTITY_INVALID = 4
+ERR_QUANTITY_NOT_POSITIVE = 8
+ERR_COST_INVALID = 16
+ERR_COST_NEGATIVE = 32
+
+# Warning bits
+WARN_DATE_OLD = 1
+WARN_QUANTITY_HIGH = 2
+WARN_COST_HIGH = 4
+
+# Marks a fill date that could not be parsed
+DATE_MISSING = np.iinfo(np.int64).min
+
+def _check_numeric_loop(quantity, cost, date_days, today_days):
+    """Scalar loop over the batch; compiled with Numba when available"""
+    n = quantity.shape[0]
+    errors = np.zeros(n, dtype=np.uint8)
+    warnings = np.zeros(n, dtype=np.uint8)
+
+    for i in range(n):
+        # Date validation
+        if date_days[i] == DATE_MISSING:
+            errors[i] |= ERR_DATE_INVALID
+        elif date_days[i] > today_days:
+            errors[i] |= ERR_DATE_FUTURE
+        elif date_days[i] < today_days - 365:
+            warnings[i] |= WARN_DATE_OLD
+
+        # Quantity validation
+        if np.isnan(quantity[i]):
+            errors[i] |= ERR_QUANTITY_INVALID
+        elif quantity[i] <= 0:
+            errors[i] |= ERR_QUANTITY_NOT_POSITIVE
+        elif quantity[i] > 1000:
+            warnings[i] |= WARN_QUANTITY_HIGH
+
+        # Cost validation
+        if np.isnan(cost[i]):
+            errors[i] |= ERR_COST_INVALID
+        elif cost[i] < 0:
+            errors[i] |= ERR_COST_NEGATIVE
+        elif cost[i] > 50000:
+            warnings[i] |= WARN_COST_HIGH
+
+    return errors, warnings
+
+def _check_numeric_vectorized(quantity, cost, date_days, today_days):
+    """Column-at-a-time NumPy equivalent of _check_numeric_loop"""
+    date_invalid = date_days == DATE_MISSING
+    date_future = ~date_invalid & (date_days > today_days)
+    date_old = ~date_invalid & ~date_future & (date_days < today_days - 365)
+
+    quantity_invalid = np.isnan(quantity)
+    quantity_not_positive = ~quantity_invalid & (quantity <= 0)
+    quantity_high = ~quantity_invalid & (quantity > 1000)
+
+    cost_invalid = np.isnan(cost)
+    cost_negative = ~cost_invalid & (cost < 0)
+    cost_high = ~cost_invalid & (cost > 50000)
+
+    errors = (date_invalid * ERR_DATE_INVALID
+              | date_future * ERR_DATE_FUTURE
+              | quantity_invalid * ERR_QUANTITY_INVALID
+              | quantity_not_positive * ERR_QUANTITY_NOT_POSITIVE
+              | cost_invalid * ERR_COST_INVALID
+              | cost_negative * ERR_COST_NEGATIVE).astype(np.uint8)
+    warnings = (date_old * WARN_DATE_OLD
+                | quantity_high * WARN_QUANTITY_HIGH
+                | cost_high * WARN_COST_HIGH).astype(np.uint8)
+    return errors, warnings
+
+# Return (errors, warnings) bitmasks for each claim in the batch.
+# quantity/cost are float64 arrays (NaN = unparseable), date_days is an int64
+# array of days since 1970-01-01 (DATE_MISSING = unparseable).
+if NUMBA_AVAILABLE:
+    check_numeric = njit(cache=True)(_check_numeric_loop)
+    CHECK_NUMERIC_IMPL = 'numba'
+else:
+    check_numeric = _check_numeric_vectorized
+    CHECK_NUMERIC_IMPL = 'numpy'